@@ -1,50 +1,110 @@
 import tkinter as tk
 from tkinter import ttk, messagebox
 from matplotlib.backends.backend_tkagg import FigureCanvasTkAgg
-import matplotlib.pyplot as plt
+from matplotlib.figure import Figure
 import matplotlib.dates as mdates
-from datetime import datetime, timedelta
+from matplotlib.collections import LineCollection
+import numpy as np
+from datetime import date, datetime
 from collections import defaultdict
+import mmap
 import os
+import threading
 
 FILE_PATH = "Anti-Finger.txt"
 
+# แคชผลการอ่านไฟล์: ตำแหน่งไบต์ที่อ่านแล้ว (offset, ถึง \n ตัวสุดท้าย) + จำนวนครั้งต่อวัน (key = date ordinal)
+# เมื่อไฟล์โตขึ้นจะอ่านเฉพาะส่วนที่ต่อท้ายเข้ามาใหม่ ถ้า (mtime, size) ไม่เปลี่ยนคืน history เดิมเลย
+_cache = {'offset': 0, 'size': None, 'counts': defaultdict(int), 'mtime': None, 'history': []}
+# _load_history อ่านใน background thread ได้หลายตัวพร้อมกัน -> แก้ _cache ทีละ thread
+_cache_lock = threading.Lock()
+
+# ตำแหน่งตัวเลขของ YYYY-MM-DD ใน "[YYYY-MM-DD HH:MM:SS]" และน้ำหนักหลัก -> yyyymmdd
+_DATE_DIGITS = np.array([1, 2, 3, 4, 6, 7, 9, 10])
+_DATE_WEIGHTS = 10 ** np.arange(7, -1, -1, dtype=np.int64)
+
+def _parse_new_lines(buf, counts):
+    """นับบรรทัดใน buf (uint8 array) ลง counts
+
+    ท้าย buf ถือเป็นจุดจบบรรทัดด้วย (บรรทัดสุดท้ายไม่ต้องมี \n เหมือนการอ่านทีละบรรทัด)
+    สแกนทั้งก้อนด้วย NumPy (ไม่วนทีละบรรทัดใน Python) แล้วแปลงเป็นวันที่
+    เฉพาะค่าที่ไม่ซ้ำ ซึ่งมีแค่วันละค่าเดียว
+    """
+    ends = np.flatnonzero(buf == ord("\n"))
+    if len(buf) and buf[-1] != ord("\n"):
+        ends = np.append(ends, len(buf))
+    if not len(ends):
+        return
+    starts = np.concatenate(([0], ends[:-1] + 1))
+    starts = starts[ends - starts >= 20]
+    starts = starts[buf[starts] == ord("[")]
+    ok = (buf[starts + 5] == ord("-")) & (buf[starts + 8] == ord("-"))
+    digits = buf[starts[:, None] + _DATE_DIGITS] - ord("0")  # uint8: ไม่ใช่ตัวเลข -> > 9
+    ok &= (digits <= 9).all(axis=1)
+    keys = digits[ok].astype(np.int64) @ _DATE_WEIGHTS
+
+    days, day_counts = np.unique(keys, return_counts=True)
+    for key, c in zip(days.tolist(), day_counts.tolist()):
+        try:
+            counts[date(key // 10000, key // 100 % 100, key % 100).toordinal()] += c
+        except ValueError:
+            continue
+
 def get_history_from_file():
-    daily_counts = defaultdict(int)
-    if not os.path.exists(FILE_PATH):
-        return []
-
-    # อ่านไฟล์และนับจำนวนครั้งต่อวัน
-    with open(FILE_PATH, "r", encoding="utf-8") as f:
-        for line in f:
-            try:
-                date_str = line.split("]")[0][1:]
-                date = datetime.strptime(date_str, "%Y-%m-%d %H:%M:%S")
-                daily_counts[date.date()] += 1
-            except:
-                continue
-
-    history = []
-    if not daily_counts:
-        return history
+    """อ่าน history จากไฟล์ (ใช้ _cache ร่วมกัน -> ล็อกไว้ กัน refresh ที่ซ้อนกันนับซ้ำ)"""
+    with _cache_lock:
+        if not os.path.exists(FILE_PATH):
+            _cache.update(offset=0, size=None, counts=defaultdict(int), mtime=None, history=[])
+            return []
+
+        # อ่านไฟล์และนับจำนวนครั้งต่อวัน
+        st = os.stat(FILE_PATH)
+        if st.st_mtime_ns == _cache['mtime'] and st.st_size == _cache['size']:
+            return _cache['history']
+        if st.st_size < _cache['offset']:
+            # ไฟล์ถูกลบ/เขียนทับใหม่ -> เริ่มนับใหม่ทั้งหมด
+            _cache['offset'] = 0
+            _cache['counts'] = defaultdict(int)
+        counts_by_day = _cache['counts']
+        if st.st_size > _cache['offset']:
+            # mmap แล้วมองเป็น array โดยตรง (ไม่ copy ไฟล์เข้า Python bytes)
+            with open(FILE_PATH, "rb") as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                start = _cache['offset']
+                end = max(mm.rfind(b"\n", start) + 1, start)
+                buf = np.frombuffer(mm, dtype=np.uint8, offset=start)
+                _parse_new_lines(buf[:end - start], counts_by_day)
+                if end < len(mm):
+                    # บรรทัดสุดท้ายไม่มี \n: นับเข้าผลรอบนี้ แต่ไม่เก็บลงแคช
+                    # (offset หยุดที่ \n ตัวสุดท้าย ถ้ามีการเขียนต่อบรรทัดนี้จะอ่านใหม่ทั้งบรรทัด)
+                    counts_by_day = counts_by_day.copy()
+                    _parse_new_lines(buf[end - start:], counts_by_day)
+                del buf  # ต้องปล่อย view ก่อนปิด mmap
+            _cache['offset'] = end
+        _cache['mtime'] = st.st_mtime_ns
+        _cache['size'] = st.st_size
+
+        history = []
+        _cache['history'] = history
+        if not counts_by_day:
+            return history
 
-    first_day = min(daily_counts.keys())
-    last_day = max(daily_counts.keys())
-    day = first_day
-    while day <= last_day:
-        count = daily_counts.get(day, 0)
-        sets_done = count // 10
-        progress = min((count / 30) * 100, 100) if count > 0 else 0
-        history.append({
-            'date': datetime.combine(day, datetime.min.time()),
-            'progress': progress,
-            'sets_done': sets_done,
-            'count': count
-        })
-        day += timedelta(days=1)
-
-    history.sort(key=lambda x: x['date'])
-    return history
+        # นับจำนวนครั้งต่อวันลงใน bucket ต่อเนื่อง (วันที่ไม่มีข้อมูล = 0)
+        base = min(counts_by_day)
+        counts = [0] * (max(counts_by_day) - base + 1)
+        for o, c in counts_by_day.items():
+            counts[o - base] = c
+
+        # bucket เรียงตามวันอยู่แล้ว ไม่ต้อง sort
+        for i, count in enumerate(counts):
+            dt = datetime.fromordinal(base + i)
+            history.append({
+                'date': dt,
+                'date_str': dt.strftime('%d-%b-%Y'),  # จัดรูปแบบครั้งเดียว ใช้ทั้ง combo และ feedback
+                'progress': min((count / 30) * 100, 100) if count > 0 else 0,
+                'sets_done': count // 10,
+                'count': count
+            })
+        return history
 
 class ProgressChart:
     def __init__(self, parent, get_history_func):
@@ -82,33 +142,83 @@ class ProgressChart:
         self.feedback_label.pack(fill='x', pady=10)
 
         # Figure and canvas
-        self.fig, self.ax = plt.subplots(figsize=(8,4))
+        # ใช้ Figure ตรง ๆ (ไม่ผ่าน pyplot) -> ไม่มีการเลือก backend/toolbar/global state
+        self.fig = Figure(figsize=(8,4))
+        self.ax = self.fig.add_subplot()
+
+        # ค่าแกนที่ไม่เปลี่ยน ตั้งครั้งเดียว (tick ที่สร้างใหม่ได้ labelrotation ตาม tick_params
+        # ต่างจาก autofmt_xdate ที่หมุนเฉพาะ label ที่มีอยู่ตอนเรียก)
+        # x เป็นเลขวันจาก date2num -> บอกแกนว่าเป็นวันที่ ให้ tick ลงวันเต็ม
+        # (minticks=2: ประวัติสั้น ๆ ไม่ถูกแบ่งเป็นรายชั่วโมงจน label วันซ้ำ)
+        self.ax.xaxis_date()
+        self.ax.xaxis.set_major_locator(mdates.AutoDateLocator(minticks=2))
+        self.ax.xaxis.set_major_formatter(mdates.DateFormatter('%d-%b'))
+        self.ax.set_ylabel("Progress (%)")
+        self.ax.set_ylim(0,110)
+        self.ax.set_title("Progress Chart")
+        self.ax.grid(True, linestyle='--', alpha=0.5)
+        self.ax.tick_params(axis='x', labelrotation=30)
+        # จัดชิดขวาแบบ autofmt_xdate (tick ใหม่คัดลอก ha จาก tick แรก จึงตั้งครั้งเดียวพอ)
+        for label in self.ax.get_xticklabels():
+            label.set_horizontalalignment('right')
+        self.fig.subplots_adjust(bottom=0.2)
         self.canvas = FigureCanvasTkAgg(self.fig, master=self.chart_frame)
         self.canvas.get_tk_widget().pack(fill=tk.BOTH, expand=True)
 
-        self.canvas.mpl_connect("button_press_event", self.on_click)
+        self.canvas.mpl_connect("pick_event", self.on_pick)
+
+        # สร้าง artist ครั้งเดียว แล้วอัปเดตข้อมูลใน draw_chart (ไม่ต้อง ax.clear)
+        empty = np.empty((0, 2))
+        self.thin_bars = self.ax.add_collection(LineCollection([], linewidths=2))
+        self.thick_bars = self.ax.add_collection(LineCollection([], linewidths=8))
+        self.up_arrows = self.ax.scatter(empty[:, 0], empty[:, 1], marker='$↑$', color='green', s=120)
+        self.down_arrows = self.ax.scatter(empty[:, 0], empty[:, 1], marker='$↓$', color='orange', s=120)
+        self.dots = self.ax.scatter(empty[:, 0], empty[:, 1], c='black', zorder=3, picker=True, pickradius=5)
+        # จุดไฮไลต์วันที่เลือก (animated -> ไม่ถูกวาดในพื้นหลัง วาดทับด้วย blit)
+        self.highlight, = self.ax.plot([], [], 'o', markersize=14, markerfacecolor='none',
+                                       markeredgecolor='blue', markeredgewidth=2, animated=True)
+        # เก็บพื้นหลังทุกครั้งที่วาดเต็ม (รวมตอน resize) เพื่อใช้ blit จุดที่เลือก
+        self._bg = None
+        self._selected_idx = None
+        self.canvas.mpl_connect("draw_event", self._on_draw)
 
-        # ดึงข้อมูลและสร้าง combo วัน
-        self.history = self.get_history_func()
+        # ดึงข้อมูลใน thread แยก ไม่ให้ UI ค้างตอนอ่านไฟล์ แล้วค่อยสร้าง combo วัน + กราฟ
+        self.history = []
+        self._date_index = {}
+        threading.Thread(target=self._load_history, daemon=True).start()
+
+    def _load_history(self):
+        """อ่านไฟล์ใน background แล้วส่งผลกลับไป Tk main thread"""
+        try:
+            history = self.get_history_func()
+        except Exception as e:
+            print("Error:", e)
+            return
+        self.parent.after(0, self._on_history_loaded, history)
+
+    def _on_history_loaded(self, history):
+        self.history = history
         self.populate_date_combo()
         self.draw_chart()
 
     def populate_date_combo(self):
-        dates = [h['date'].strftime('%d-%b-%Y') for h in self.history]
+        dates = [h['date_str'] for h in self.history]
+        self._date_index = {s: i for i, s in enumerate(dates)}
         self.date_combo['values'] = dates
         if dates:
             self.date_var.set(dates[-1])  # เลือกวันล่าสุดเป็น default
 
-    def progress_color(self, prog, prev_prog):
-        """กำหนดสีตามการเปรียบเทียบกับวันก่อนหน้า"""
-        if prev_prog is None:
-            return (1,0,0) if prog < 50 else (0,1,0)  # แดงหรือเขียวตามปกติ
-        if prog > prev_prog:
-            return (0,1,0)  # เขียว = ดีขึ้น
-        elif prog < prev_prog:
-            return (1,0.65,0)  # เหลือง = ลดลง
-        else:
-            return (1,0,0) if prog < 50 else (0,1,0)  # แดง/เขียวตามปกติ
+    def progress_colors(self, prog, prev_prog):
+        """กำหนดสีทุกจุดพร้อมกันตามการเปรียบเทียบกับวันก่อนหน้า -> array (N,3)"""
+        up = prog > prev_prog
+        down = prog < prev_prog
+        same = ~(up | down)  # รวมจุดแรก (prev_prog[0] == prog[0])
+        colors = np.zeros((len(prog), 3))
+        colors[up] = (0,1,0)  # เขียว = ดีขึ้น
+        colors[down] = (1,0.65,0)  # เหลือง = ลดลง
+        colors[same & (prog < 50)] = (1,0,0)  # แดง/เขียวตามปกติ
+        colors[same & (prog >= 50)] = (0,1,0)
+        return colors
 
     def feedback_text(self, prog, prev_prog):
         if prog == 0:
@@ -123,44 +233,43 @@ class ProgressChart:
             return "วันนี้คุณทำได้ตามปกติ"
 
     def draw_chart(self):
-        self.dates = [h['date'] for h in self.history]
-        self.progresses = [h['progress'] for h in self.history]
-        self.sets_done = [h['sets_done'] for h in self.history]
-
-        o, h_, l, c = [], [], [], []
-        prev = self.progresses[0] if self.progresses else 0
-        self.points = []
-        for i, p in enumerate(self.progresses):
-            o.append(prev)
-            c.append(p)
-            high = max(prev,p)
-            low = min(prev,p)
-            h_.append(high)
-            l.append(low)
-            prev = p
-
-        self.ax.clear()
-        for i, p in enumerate(self.progresses):
-            prev_prog = self.progresses[i-1] if i > 0 else None
-            color = self.progress_color(p, prev_prog)
-            self.ax.vlines(self.dates[i], l[i], h_[i], color=color, linewidth=2)
-            self.ax.vlines(self.dates[i], o[i], c[i], color=color, linewidth=8)
-            # ลูกศร
-            if prev_prog is not None:
-                if p > prev_prog:
-                    self.ax.annotate('↑', xy=(self.dates[i], c[i]+3), ha='center', color='green', fontsize=12)
-                elif p < prev_prog:
-                    self.ax.annotate('↓', xy=(self.dates[i], c[i]+3), ha='center', color='orange', fontsize=12)
-            point, = self.ax.plot(self.dates[i], c[i], 'o', color='black', picker=5)
-            self.points.append((point, self.dates[i], p, self.sets_done[i], i))
+        n = len(self.history)
+        self.progresses = np.fromiter((h['progress'] for h in self.history), dtype=np.float64, count=n)
+        self.sets_done = np.fromiter((h['sets_done'] for h in self.history), dtype=np.int64, count=n)
 
-        self.ax.xaxis.set_major_formatter(mdates.DateFormatter('%d-%b'))
-        self.ax.set_ylabel("Progress (%)")
-        self.ax.set_ylim(0,110)
-        self.ax.set_title("Progress Chart")
-        self.ax.grid(True, linestyle='--', alpha=0.5)
-        self.fig.autofmt_xdate()
-        self.canvas.draw()
+        # history เป็นวันต่อเนื่อง -> แกน x = วันแรก + 0..n-1
+        x = mdates.date2num(self.history[0]['date']) + np.arange(n) if n else np.empty(0)
+
+        # OHLC: open = วันก่อนหน้า, close = วันนี้
+        close_ = self.progresses
+        open_ = np.empty_like(close_)
+        open_[:1] = close_[:1]
+        open_[1:] = close_[:-1]
+        high = np.maximum(open_, close_)
+        low = np.minimum(open_, close_)
+        colors = self.progress_colors(close_, open_)
+        self._x = x
+
+        # วาดแท่งทั้งหมดเป็น collection เดียว แทน vlines ทีละจุด
+        thin = np.stack([np.column_stack([x, low]), np.column_stack([x, high])], axis=1)
+        thick = np.stack([np.column_stack([x, open_]), np.column_stack([x, close_])], axis=1)
+        self.thin_bars.set_segments(thin)
+        self.thin_bars.set_color(colors)
+        self.thick_bars.set_segments(thick)
+        self.thick_bars.set_color(colors)
+
+        # ลูกศร: หนึ่ง collection ต่อทิศทาง
+        up = close_[1:] > close_[:-1]
+        down = close_[1:] < close_[:-1]
+        self.up_arrows.set_offsets(np.column_stack([x[1:][up], close_[1:][up] + 3]))
+        self.down_arrows.set_offsets(np.column_stack([x[1:][down], close_[1:][down] + 3]))
+
+        self.dots.set_offsets(np.column_stack([x, close_]))
+        # relim() ไม่นับ collection จึงกำหนดแกน x เอง
+        if len(x):
+            self.ax.set_xlim(x[0] - 1, x[-1] + 1)
+
+        self.canvas.draw_idle()
 
         self.update_feedback()
 
@@ -168,8 +277,7 @@ class ProgressChart:
         selected_date_str = self.date_var.get()
         if not selected_date_str:
             return
-        selected_date = datetime.strptime(selected_date_str, '%d-%b-%Y').date()
-        idx = next((i for i, h in enumerate(self.history) if h['date'].date() == selected_date), None)
+        idx = self._date_index.get(selected_date_str)
         if idx is None:
             return
         prog = self.history[idx]['progress']
@@ -177,18 +285,38 @@ class ProgressChart:
         prev_prog = self.history[idx-1]['progress'] if idx > 0 else None
         feedback = self.feedback_text(prog, prev_prog)
         self.feedback_label.config(text=f"{selected_date_str}\nProgress: {prog:.0f}%\nSets: {sets}\n{feedback}")
+        self.select_point(idx)
+
+    def on_pick(self, event):
+        if event.artist is not self.dots or not len(event.ind):
+            return
+        idx = event.ind[0]
+        prog = self.progresses[idx]
+        prev_prog = self.progresses[idx-1] if idx > 0 else None
+        feedback = self.feedback_text(prog, prev_prog)
+        date_str = self.history[idx]['date_str']
+        self.feedback_label.config(text=f"{date_str}\nProgress: {prog:.0f}%\nSets: {self.sets_done[idx]}\n{feedback}")
+        self.select_point(idx)
+
+    def _on_draw(self, event):
+        """หลังวาดเต็มทุกครั้ง เก็บพื้นหลังใหม่แล้ววาดไฮไลต์ทับ"""
+        self._bg = self.canvas.copy_from_bbox(self.ax.bbox)
+        self._blit_highlight()
+
+    def select_point(self, idx):
+        """ย้ายไฮไลต์ไปยังจุด idx โดย blit เฉพาะ artist เดียว ไม่ repaint ทั้งกราฟ"""
+        self._selected_idx = idx
+        self.highlight.set_data([self._x[idx]], [self.progresses[idx]])
+        if self._bg is None:
+            return
+        self.canvas.restore_region(self._bg)
+        self._blit_highlight()
 
-    def on_click(self, event):
-        if event.inaxes != self.ax:
+    def _blit_highlight(self):
+        if self._selected_idx is None:
             return
-        for point, date, prog, sets, idx in self.points:
-            xdata = mdates.date2num(date)
-            ydata = prog
-            if abs(event.xdata - xdata) < 0.3 and abs(event.ydata - ydata) < 5:
-                prev_prog = self.progresses[idx-1] if idx > 0 else None
-                feedback = self.feedback_text(prog, prev_prog)
-                self.feedback_label.config(text=f"{date.strftime('%d-%b-%Y')}\nProgress: {prog:.0f}%\nSets: {sets}\n{feedback}")
-                return
+        self.ax.draw_artist(self.highlight)
+        self.canvas.blit(self.ax.bbox)
 
 if __name__ == "__main__":
     try:
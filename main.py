@@ -18,19 +18,83 @@ from logging import root
 from PIL import Image, ImageTk           # Image processing + Tkinter bridge
 import customtkinter as ctk              # Modern Tkinter look-and-feel
 import cv2                               # OpenCV for camera I/O and image ops
+import numpy as np                       # Vectorized landmark math
 import mediapipe as mp                   # MediaPipe Hands: landmark detector
 import pygame                            # For playing short sound cues
 import time, threading                   # Threading for background loops, time helpers
-from datetime import datetime,timedelta           # Timestamps for logging
+import math                              # ceil for timer countdown text
+import queue                             # Single-slot hand-off between pipeline threads
+import codecs, io                        # Incremental UTF-8 + newline decode of the appended log
+from datetime import date, datetime, timedelta    # Timestamps for logging
 from matplotlib.backends.backend_tkagg import FigureCanvasTkAgg
-import matplotlib.pyplot as plt
+from matplotlib.figure import Figure
+from matplotlib.collections import LineCollection
 import matplotlib.dates as mdates
 from collections import defaultdict
+from functools import lru_cache
 import sys,os
 import tkinter as tk
 from tkinter import ttk
 # ============================================================
 
+# ==== Hand Landmark Indices =================================
+# Per finger (thumb, index, middle, ring, pinky): (MCP joint the angle is
+# measured at, fingertip). For the thumb that is THUMB_MCP (2), not the CMC (1).
+# Landmark 0 = wrist.
+FINGER_MCP_TIP = ((2, 4), (5, 8), (9, 12), (13, 16), (17, 20))
+MCP_IDX, TIP_IDX = (np.array(idx) for idx in zip(*FINGER_MCP_TIP))
+
+# Optional MediaPipe Tasks model. When present, hand tracking runs through
+# HandLandmarker on the GPU delegate; otherwise the CPU-only Hands solution is used.
+HAND_MODEL_PATH = "hand_landmarker.task"
+
+# Long side (px) of the frame handed to the hand detector. The landmark model
+# works at ~224 px, so larger inputs only cost resampling time inside MediaPipe.
+INFER_LONG_SIDE = 256
+
+# Only every Nth frame is run through the detector; the frames in between reuse
+# the last landmarks. Searching for a pose: ~15 Hz on a 30 FPS camera; holding
+# one (hand_posit == 5) only needs to notice when it is released.
+SEARCH_INFER_EVERY = 2
+HOLD_INFER_EVERY = 6
+
+# Upper bound on preview updates handed to Tk, whatever rate the camera delivers
+PREVIEW_MAX_FPS = 15
+
+# Period of the single Tk tick that animates the countdown and the timer arc
+TIMER_TICK_S = 0.033
+
+# History page shows only the tail of Anti-Finger.txt: the first load reads at most
+# HISTORY_TAIL_BYTES and the textbox is trimmed to the last HISTORY_TAIL_LINES lines.
+HISTORY_TAIL_BYTES = 65536
+HISTORY_TAIL_LINES = 1000
+
+# Camera-check fallback: counts as a finger press when more than this fraction of
+# the frame is bright (> 127 gray). 0.054 ~= the original 50000 px at 1280x720.
+BRIGHT_FRACTION = 0.054
+
+# Landmarks are drawn on the RGB frame, so colors are RGB (green dots, blue lines)
+LANDMARK_COLOR = (0, 255, 0)
+CONNECTION_COLOR = (0, 0, 255)
+# mp.solutions.hands.HAND_CONNECTIONS as 6 open polylines (one cv2.polylines call)
+HAND_PATHS = [np.array(p) for p in (
+    (0, 1, 2, 3, 4), (0, 5, 6, 7, 8), (5, 9, 10, 11, 12),
+    (9, 13, 14, 15, 16), (13, 17, 18, 19, 20), (0, 17),
+)]
+# ============================================================
+
+
+# ==== Image Cache ===========================================
+@lru_cache(maxsize=32)
+def load_photo(path, width, height, resample=Image.BICUBIC):
+    """PhotoImage of `path` resized to width x height, decoded once per process.
+
+    Needs a Tk root. A missing file raises FileNotFoundError, which is not
+    cached, so it is retried on the next call.
+    """
+    return ImageTk.PhotoImage(Image.open(path).resize((width, height), resample))
+# ============================================================
+
 
 # --- Main Application Class ---
 class AntiTriggerFingersApp(ctk.CTk):
@@ -46,6 +110,7 @@ class AntiTriggerFingersApp(ctk.CTk):
         self.geometry("1920x1080+0+0")
         self.overrideredirect(True)       
         self.bind("<Escape>", lambda e: self.on_close())
+        self.bind("<F2>", lambda e: self.toggle_landmarks())
         self.resizable(False, False)
         self.configure(fg_color="#FFFFFF")
 
@@ -56,8 +121,11 @@ class AntiTriggerFingersApp(ctk.CTk):
         self.key_held = False
         self.time_max = 5                            # seconds required per pose
         self.time_current = self.time_max            # remaining seconds for current pose
-        self.hand_posit = 0                          # internal positive-match counter
+        self.hand_posit = 0                          # internal positive-match counter (MediaPipe thread)
+        self._hand_posit_lock = threading.Lock()     # guards hand_posit read-modify-write
         self.still_hold = False                      # flag to prevent double countdown
+        self._hold_tick = None                       # monotonic time of the next 1 s sensor tick
+        self._last_log_ts = {}                       # tag -> last print time (see _log_throttled)
         self.current_pose = 1                        # index of current exercise pose
         self.key = ""
         self.is_pass = False
@@ -73,19 +141,55 @@ class AntiTriggerFingersApp(ctk.CTk):
         ]
         self.extent = 0
         self.progress = 0
+        self.show_landmarks = True                   # draw hand skeleton on preview (F2 toggles)
+
+        # Allowed (min, max) angle per finger (thumb..pinky) for each pose.
+        # Split into lo/hi arrays once so matching is a single vector compare.
+        pose_ranges = {
+            1: [(0, 200), (150, 185), (150, 185), (150, 185), (150, 185)],
+            2: [(0, 200), (40, 170), (40, 170), (40, 170), (40, 170)],
+            3: [(0, 200), (0, 60), (0, 60), (0, 60), (0, 60)],
+            4: [(0, 200), (0, 50), (0, 50), (0, 50), (0, 50)],
+            5: [(0, 200), (50, 185), (50, 185), (50, 160), (50, 160)],
+        }
+        # (6, 5) lo/hi tables indexed directly by pose number; row 0 (no pose)
+        # falls back to pose 1, like pose_name's placeholder slot
+        bounds = np.array([pose_ranges[1]] + [pose_ranges[k] for k in range(1, 6)], dtype=np.float32)
+        self._pose_lo = bounds[..., 0]
+        self._pose_hi = bounds[..., 1]
 
         # --------------------
         # Camera setup
         # --------------------
         # OpenCV VideoCapture is used by the background MediaPipe thread.
-        self.cap = cv2.VideoCapture(0)
+        # Native backend where there is one (DirectShow / V4L2 honour MJPG + buffer
+        # size reliably); anything else, or a failed open, uses OpenCV's default.
+        backend = {"win32": cv2.CAP_DSHOW, "linux": cv2.CAP_V4L2}.get(sys.platform, cv2.CAP_ANY)
+        self.cap = cv2.VideoCapture(0, backend)
+        if not self.cap.isOpened() and backend != cv2.CAP_ANY:
+            self.cap = cv2.VideoCapture(0)
+        self.target_fps = 30                         # UI delivery rate; replaced by the driver's FPS
         if not self.cap.isOpened():
             # Fail gracefully: print message; UI will show placeholder until camera available.
             print("Error: Cannot open webcam")
         else:
             print("✓ Camera opened successfully")
-            self.cap.set(cv2.CAP_PROP_FRAME_WIDTH, 1280)
-            self.cap.set(cv2.CAP_PROP_FRAME_HEIGHT, 720)
+            # Ask the driver for small MJPG frames: MediaPipe downsizes internally anyway,
+            # so larger captures only cost copies. Buffer of 1 avoids stale queued frames.
+            # set() returns False when the backend ignores a property; report it
+            # so a camera that keeps queueing frames or sends raw YUYV is visible.
+            for prop, value, name in (
+                (cv2.CAP_PROP_FOURCC, cv2.VideoWriter_fourcc(*"MJPG"), "MJPG"),
+                (cv2.CAP_PROP_FRAME_WIDTH, 640, "width 640"),
+                (cv2.CAP_PROP_FRAME_HEIGHT, 480, "height 480"),
+                (cv2.CAP_PROP_FPS, 30, "30 FPS"),
+                (cv2.CAP_PROP_BUFFERSIZE, 1, "buffer size 1"),
+            ):
+                if not self.cap.set(prop, value):
+                    print(f"[Camera] backend ignored {name}")
+            fps = self.cap.get(cv2.CAP_PROP_FPS)
+            if fps > 0:
+                self.target_fps = fps
             print(f"✓ Camera set to: {self.cap.get(cv2.CAP_PROP_FRAME_WIDTH)}x{self.cap.get(cv2.CAP_PROP_FRAME_HEIGHT)}")
 
         # --------------------
@@ -105,10 +209,11 @@ class AntiTriggerFingersApp(ctk.CTk):
         self.black_fg = "black"
 
         # Font definitions (Sarabun used in the original; fallback handled by system)
-        self.font_large_title = ("Sarabun", 60, "bold")
-        self.font_medium_text = ("Sarabun", 50, "bold")
-        self.font_timer = ("Sarabun", 60, "bold")
-        self.font_pose_text = ("Sarabun", 50, "bold")
+        self._fonts = {}                             # (size, weight) -> shared CTkFont, see _font
+        self.font_large_title = self._font(60, "bold")
+        self.font_medium_text = self._font(50, "bold")
+        self.font_timer = ("Sarabun", 60, "bold")    # tk.Canvas text: point size, so a plain spec
+        self.font_pose_text = self._font(50, "bold")
 
         # --------------------------------------------------------------------
         # Top bar / header
@@ -120,9 +225,7 @@ class AntiTriggerFingersApp(ctk.CTk):
         self.top_bar_frame.pack_propagate(False)
 
         try:
-            logo_image_pil = Image.open("pictures/logo.png")
-            logo_image_pil = logo_image_pil.resize((140, 140))
-            self.logo_photo = ImageTk.PhotoImage(logo_image_pil)
+            self.logo_photo = load_photo("pictures/logo.png", 140, 140)
             self.logo_label = ctk.CTkLabel(
                 self.top_bar_frame, image=self.logo_photo, fg_color=self.purple_bg, text=""
             )
@@ -130,7 +233,7 @@ class AntiTriggerFingersApp(ctk.CTk):
         except FileNotFoundError:
             # Keep a clean textual placeholder instead of crashing.
             self.logo_label = ctk.CTkLabel(
-                self.top_bar_frame, text="LOGO", font=("Sarabun", 20), text_color=self.white_fg, fg_color=self.purple_bg
+                self.top_bar_frame, text="LOGO", font=self._font(20), text_color=self.white_fg, fg_color=self.purple_bg
             )
             self.logo_label.pack(side="left", padx=20, pady=10)
             print("Warning: logo.png not found. Using text placeholder.")
@@ -227,7 +330,7 @@ class AntiTriggerFingersApp(ctk.CTk):
         self.start_stop_button = ctk.CTkButton(
             self.buttons_inner,
             text="เริ่มต้น",
-            font=("Sarabun", 50, "bold"),
+            font=self._font(50, "bold"),
             fg_color=self.green_btn,
             text_color=self.white_fg,
             command=lambda: self.toggle_start_pause(),
@@ -239,7 +342,7 @@ class AntiTriggerFingersApp(ctk.CTk):
         self.reset_button = ctk.CTkButton(
             self.buttons_inner,
             text="รีเซ็ต",
-            font=("Sarabun", 50, "bold"),
+            font=self._font(50, "bold"),
             fg_color=self.red_btn,
             text_color=self.white_fg,
             command=lambda: self.reset_action(),
@@ -264,13 +367,24 @@ class AntiTriggerFingersApp(ctk.CTk):
         top = self.timer_pad
         right = self.timer_canvas_size - self.timer_pad
         bottom = self.timer_canvas_size - self.timer_pad
-        # draw initial neutral circle
-        self.timer_canvas.create_oval(left, top, right, bottom, outline="#3CB371", width=10, tags="progress")
+        # Neutral circle + progress arc are created once; the timer only shows/hides
+        # them and updates the arc's extent/color (no per-tick item churn).
+        self.timer_ring_id = self.timer_canvas.create_oval(left, top, right, bottom, outline="#3CB371", width=10)
+        self.timer_arc_id = self.timer_canvas.create_arc(
+            left, top, right, bottom, start=-90, extent=0, style="arc", width=10, outline="#3CB371", state="hidden"
+        )
         center = self.timer_canvas_size // 2
         self.timer_text = self.timer_canvas.create_text(center, center, text=f"{self.time_current}", font=self.font_timer, fill=self.black_fg)
 
+        # Last values pushed to the canvas; unchanged updates are skipped so Tk
+        # only redraws when the visible number or arc actually changes.
+        self._timer_text_value = str(self.time_current)
+        self._timer_arc_state = None                 # None = ring shown, else (extent, color)
+
         # Timer animation bookkeeping variables (used by _animate_timer)
-        self.timer_anim_job = None
+        self._tick_job = None                        # pending _timer_tick, None when idle
+        self._tick_deadline = 0.0
+        self._timer_anim_active = False
         self._timer_anim_from = 0.0
         self._timer_anim_to = 0.0
         self._timer_anim_start = 0.0
@@ -279,17 +393,19 @@ class AntiTriggerFingersApp(ctk.CTk):
         # --------------------------------------------------------------------
         # Right column bottom: example pose (small image) + history button
         # --------------------------------------------------------------------
-        # Load example pose image if it exists; otherwise show placeholder text.
-        try:
-            small_hand_image_pil = Image.open("pictures/EX_POSE/pose1.png")
-            small_hand_image_pil = small_hand_image_pil.resize((300, 300), Image.LANCZOS)
-            self.small_hand_photo = ImageTk.PhotoImage(small_hand_image_pil)
+        # All five example pose images are decoded + resized once here, so a pose
+        # change only swaps the label image. Missing files are retried on use.
+        pose_photos = [self._get_pose_photo(i) for i in range(1, 6)]
+
+        # Show pose 1 if it exists; otherwise show placeholder text.
+        if pose_photos[0] is not None:
+            self.small_hand_photo = pose_photos[0]
             self.small_hand_label = ctk.CTkLabel(self.main_content_frame, image=self.small_hand_photo, text="")
             self.small_hand_label.grid(row=1, column=2, padx=20, pady=(0, 20), sticky="n")
-        except FileNotFoundError:
+        else:
             # Keep a clear textual placeholder instead of failing.
             self.small_hand_label = ctk.CTkLabel(
-                self.main_content_frame, text="Small Hand\nImage\n(Placeholder)", font=("Sarabun", 16), bg="lightgray", width=15, height=10
+                self.main_content_frame, text="Small Hand\nImage\n(Placeholder)", font=self._font(16), bg="lightgray", width=15, height=10
             )
             self.small_hand_label.grid(row=1, column=2, padx=20, pady=(0, 20), sticky="n")
             print("Warning: small_hand.png not found. Using text placeholder.")
@@ -300,7 +416,7 @@ class AntiTriggerFingersApp(ctk.CTk):
         self.log_button = ctk.CTkButton(
             self.small_hand_bottom_frame,
             text="รายงาน",
-            font=("Sarabun", 50, "bold"),
+            font=self._font(50, "bold"),
             fg_color="#4285F4",
             text_color=self.white_fg,
             command=lambda: self.show_history_page(),
@@ -314,7 +430,7 @@ class AntiTriggerFingersApp(ctk.CTk):
         # History page: separate frame shown when user clicks "รายงาน"
         # --------------------------------------------------------------------
         self.history_page = ctk.CTkFrame(self, fg_color=self.light_gray_bg_program)
-        self.history_title = ctk.CTkLabel(self.history_page, text="รายงานย้อนหลัง", font=("Sarabun", 55, "bold"), text_color=self.black_fg)
+        self.history_title = ctk.CTkLabel(self.history_page, text="รายงานย้อนหลัง", font=self._font(55, "bold"), text_color=self.black_fg)
         self.history_title.pack(pady=5)
         
         # Chart container (กราฟอยู่บนสุด)
@@ -323,6 +439,7 @@ class AntiTriggerFingersApp(ctk.CTk):
             bg="white"
         )
         self.chart_container.pack(fill="both", expand=True, padx=40, pady=(10, 5))
+        self._build_history_chart()
         self.history_content_frame = ctk.CTkFrame(self.history_page, fg_color=self.light_gray_bg_program)
         self.history_content_frame.pack(fill="x", padx=40, pady=(0, 0))
 
@@ -331,7 +448,7 @@ class AntiTriggerFingersApp(ctk.CTk):
             self.history_content_frame,
             width=1000,
             height=250,
-            font=("Sarabun", 20),
+            font=self._font(20),
             text_color=self.black_fg,
             fg_color="#CCC9C9",
         )
@@ -341,7 +458,7 @@ class AntiTriggerFingersApp(ctk.CTk):
         self.back_button = ctk.CTkButton(
             self.history_content_frame,
             text="กลับ",
-            font=("Sarabun", 40, "bold"),
+            font=self._font(40, "bold"),
             fg_color="#FF9800",
             text_color="white",
             hover_color="#E68900",
@@ -353,34 +470,74 @@ class AntiTriggerFingersApp(ctk.CTk):
 
         self.pose_sounds = {1: ["001.mp3"], 2: ["002.mp3"], 3: ["003.mp3"], 4: ["004.mp3"], 5: ["005.mp3"]}
         
-        # ============ HELPER: GET HISTORY FROM FILE ============
-        self.current_chart = None
-
         # ============ SOUND SETUP ============
+        # Every cue in Voices/ is decoded once here; playback just calls .play().
+        self._sounds = {}
         try:
             pygame.mixer.init(frequency=44100, size=-16, channels=2, buffer=512)
+            for name in sorted(os.listdir("Voices")):
+                if name.endswith(".mp3"):
+                    try:
+                        self._sounds[name] = pygame.mixer.Sound(f"Voices/{name}")
+                    except Exception as e:
+                        print(f"[Sound] Cannot load {name}: {e}")
         except Exception as e:
             # Non-fatal: continue without audio
             print(f"[Sound] Pygame mixer init error: {e}")
 
+        # ============ LOG FILE ============
+        # write_log only queues the line; _log_writer owns the file handle and
+        # flushes whenever the queue drains. Readers call _flush_log to wait for it.
+        self._log_q = queue.Queue()
+        self._log_thread = threading.Thread(target=self._log_writer, daemon=True)
+        self._log_thread.start()
+        # load_history bookkeeping: (mtime_ns, size) last shown + bytes already inserted
+        self._hist_text_state = None
+        self._hist_text_offset = 0
+        self._hist_decoder = None        # carries a UTF-8 char / "\r" split at EOF to the next load
+        # get_history_from_file cache: ((mtime_ns, size), history)
+        self._history_cache = None
+
         # ============ RUNTIME STATE ============
         self.running = False
         self.countdown_active = False
-        self.countdown_job = None
         self.countdown_total = 0
         self.countdown_end_time = 0
 
-        # ============ START MEDIAPIPE THREAD ============
+        # ============ START CAPTURE / MEDIAPIPE / UI-DELIVERY THREADS ============
+        # Stages hand off through single-slot queues, so a slow stage drops stale
+        # frames instead of blocking the ones before it.
+        self._frame_q = queue.Queue(maxsize=1)
+        self._latest_frame = None        # newest raw frame, read by check_fingers
+        self._result_q = queue.Queue(maxsize=1)
+        self._pending_ui = None          # newest preview image for the Tk thread
+        self._pending_ui_lock = threading.Lock()
+        self._drain_scheduled = False
         self.mp_running = True
+        self._preview_visible = True     # set by show_main_page / show_history_page
+        self.capture_thread = threading.Thread(target=self._capture_loop, daemon=True)
         self.mp_thread = threading.Thread(target=self._mediapipe_loop, daemon=True)
+        self.encode_thread = threading.Thread(target=self._encode_loop, daemon=True)
+        self.capture_thread.start()
         self.mp_thread.start()
-
-        self.check_sensor_loop()
+        self.encode_thread.start()
 
         self.protocol("WM_DELETE_WINDOW", self.on_close)
 
+    def _font(self, size, weight="normal"):
+        """Shared Sarabun CTkFont for (size, weight), created on first use.
+
+        For CTk widgets only: CTkFont sizes are in pixels, so plain tk widgets
+        keep their ("Sarabun", size) point-size specs.
+        """
+        font = self._fonts.get((size, weight))
+        if font is None:
+            font = self._fonts[(size, weight)] = ctk.CTkFont(family="Sarabun", size=size, weight=weight)
+        return font
+
     def get_history_from_file(self):
         """Read history from file and return processed data"""
+        self._flush_log()
         FILE_PATH = "Anti-Finger.txt"
         DAILY_TARGET_REPS = 30  # change this if your daily target (in reps) differs
         poses_per_rep = 5
@@ -388,8 +545,14 @@ class AntiTriggerFingersApp(ctk.CTk):
 
         daily_poses = defaultdict(int)
 
-        if not os.path.exists(FILE_PATH):
+        try:
+            st = os.stat(FILE_PATH)
+        except FileNotFoundError:
             return []
+        # Log unchanged since the last parse -> reuse the result
+        key = (st.st_mtime_ns, st.st_size)
+        if self._history_cache is not None and self._history_cache[0] == key:
+            return self._history_cache[1]
 
         try:
             with open(FILE_PATH, "r", encoding="utf-8") as f:
@@ -401,9 +564,8 @@ class AntiTriggerFingersApp(ctk.CTk):
                     if not line.startswith("["):
                         continue
                     try:
-                        date_str = line.split("]")[0][1:]
-                        date = datetime.strptime(date_str, "%Y-%m-%d %H:%M:%S")
-                        daily_poses[date.date()] += 1
+                        # only the YYYY-MM-DD part is needed; fromisoformat is C-parsed
+                        daily_poses[date.fromisoformat(line[1:11])] += 1
                     except Exception:
                         # if parsing fails, skip this line
                         continue
@@ -411,10 +573,11 @@ class AntiTriggerFingersApp(ctk.CTk):
             print(f"Error reading file: {e}")
             return []
 
+        history = []
         if not daily_poses:
-            return []
+            self._history_cache = (key, history)
+            return history
 
-        history = []
         first_day = min(daily_poses.keys())
         last_day = max(daily_poses.keys())
         day = first_day
@@ -430,7 +593,7 @@ class AntiTriggerFingersApp(ctk.CTk):
                 progress = 0.0
 
             history.append({
-                'date': datetime.combine(day, datetime.min.time()),
+                'date': datetime.fromordinal(day.toordinal()),
                 'poses': poses,
                 'reps': reps,
                 'sets_done': sets_done,
@@ -439,213 +602,263 @@ class AntiTriggerFingersApp(ctk.CTk):
 
             day += timedelta(days=1)
 
-        history.sort(key=lambda x: x['date'])
+        # days are generated in order, so no sort is needed
+        self._history_cache = (key, history)
         return history
 
+    def _build_history_chart(self):
+        """Create the history chart widgets, figure and artists once.
+
+        draw_progress_chart only swaps the data, so reopening the history page
+        never rebuilds Tk widgets or matplotlib figures.
+        """
+        # "No data" / error message, shown instead of the chart when needed
+        self.chart_message = tk.Label(self.chart_container, text="", bg="white", font=("Sarabun", 14))
+
+        # Main frame สำหรับ chart + control
+        self.chart_main_frame = tk.Frame(self.chart_container, bg="white")
+
+        # Chart frame (ซ้าย)
+        chart_frame = tk.Frame(self.chart_main_frame, bg="white")
+        chart_frame.pack(side=tk.LEFT, fill=tk.BOTH, expand=True)
+
+        # Control frame (ขวา)
+        control_frame = tk.Frame(self.chart_main_frame, bg="white", width=200, height=400)
+        control_frame.pack(side=tk.RIGHT, fill=tk.Y, padx=10, pady=10)
+        control_frame.pack_propagate(False)
+
+        # Dropdown เลือกวัน
+        tk.Label(control_frame, text="Select Date:", bg="white", font=("Sarabun", 14)).pack(anchor='w', pady=5)
+        self.chart_date_var = tk.StringVar()
+        self.chart_date_combo = ttk.Combobox(control_frame, textvariable=self.chart_date_var, width=15, state='readonly')
+        self.chart_date_combo.pack(anchor='w', padx=5)
+
+        # Legend
+        tk.Label(control_frame, text="\nLegend", bg="white", font=("Sarabun", 12, "bold")).pack(anchor='w', pady=(10, 5))
+        tk.Label(control_frame, text="🔴 Red: <50%", bg="white", fg="red", font=("Sarabun", 12)).pack(anchor='w')
+        tk.Label(control_frame, text="🟢 Green: ≥50%", bg="white", fg="green", font=("Sarabun", 12)).pack(anchor='w')
+        tk.Label(control_frame, text="↑ ดีขึ้น", bg="white", fg="green", font=("Sarabun", 12)).pack(anchor='w')
+        tk.Label(control_frame, text="↓ แย่ลง", bg="white", fg="orange", font=("Sarabun", 12)).pack(anchor='w')
+
+        # Feedback label
+        self.chart_feedback_label = tk.Label(control_frame, text="", bg="lightyellow", justify='left', wraplength=400,
+                                             font=("Sarabun", 12), relief=tk.SUNKEN, padx=5, pady=5)
+        self.chart_feedback_label.pack(fill='x', pady=10, padx=5)
+
+        # Figure (not pyplot: nothing is registered globally, so nothing leaks)
+        fig = Figure(figsize=(12, 5), dpi=80)
+        fig.patch.set_facecolor('white')
+        ax = fig.add_subplot()
+        ax.xaxis_date()
+        ax.xaxis.set_major_formatter(mdates.DateFormatter('%d-%b'))
+        ax.tick_params(axis='x', labelrotation=30)
+        ax.set_ylabel("ความสำเร็จ (%)", font={'family': 'Sarabun', 'size': 18, 'weight': 'bold'})
+        ax.set_ylim(0, 110)
+        ax.set_title("สถิติของคุณ", font={'family': 'Sarabun', 'size': 18, 'weight': 'bold'})
+        ax.grid(True, linestyle='--', alpha=0.5)
+
+        # Persistent artists; draw_progress_chart only updates their data
+        self._chart_thin = ax.add_collection(LineCollection([], linewidths=2), autolim=False)
+        self._chart_thick = ax.add_collection(LineCollection([], linewidths=8), autolim=False)
+        self._chart_points = ax.scatter([], [], s=64, color='black', zorder=3)
+        self._chart_arrows = []
+
+        canvas = FigureCanvasTkAgg(fig, master=chart_frame)
+        canvas.get_tk_widget().pack(fill="both", expand=True)
+
+        self.chart_date_combo.bind("<<ComboboxSelected>>", self._update_chart_feedback)
+        canvas.mpl_connect("button_press_event", self._on_chart_click)
+
+        self.current_chart = (fig, canvas)
+        self._chart_ax = ax
+        self._chart_history = None
+        self._chart_date_index = {}
+        self._chart_x = self._chart_c = np.empty(0)
+
+    def _show_chart_message(self, text, fg="black"):
+        self.chart_main_frame.pack_forget()
+        self.chart_message.configure(text=text, fg=fg)
+        self.chart_message.pack(fill="both", expand=True)
+
     def draw_progress_chart(self):
         """Draw the progress chart in history page"""
         history = self.get_history_from_file()
-        
-        # Clear previous chart
-        for widget in self.chart_container.winfo_children():
-            widget.destroy()
+        # get_history_from_file returns the same list while the log is unchanged
+        if history is self._chart_history:
+            return
+        self._chart_history = history
 
         if not history:
-            label = tk.Label(self.chart_container, text="No data available", bg="white", font=("Sarabun", 14))
-            label.pack(fill="both", expand=True)
+            self._show_chart_message("No data available")
             return
 
         try:
-            # Main frame สำหรับ chart + control
-            main_frame = tk.Frame(self.chart_container, bg="white")
-            main_frame.pack(fill=tk.BOTH, expand=True)
-
-            # Chart frame (ซ้าย)
-            chart_frame = tk.Frame(main_frame, bg="white")
-            chart_frame.pack(side=tk.LEFT, fill=tk.BOTH, expand=True)
-
-            # Control frame (ขวา)
-            control_frame = tk.Frame(main_frame, bg="white", width=200, height=400)
-            control_frame.pack(side=tk.RIGHT, fill=tk.Y, padx=10, pady=10)
-            control_frame.pack_propagate(False)
-
-            # Dropdown เลือกวัน
-            tk.Label(control_frame, text="Select Date:", bg="white", font=("Sarabun", 14)).pack(anchor='w', pady=5)
-            date_var = tk.StringVar()
-            date_combo = ttk.Combobox(control_frame, textvariable=date_var, width=15, state='readonly')
-            date_combo.pack(anchor='w', padx=5)
-
-            # Legend
-            tk.Label(control_frame, text="\nLegend", bg="white", font=("Sarabun", 12, "bold")).pack(anchor='w', pady=(10, 5))
-            tk.Label(control_frame, text="🔴 Red: <50%", bg="white", fg="red", font=("Sarabun", 12)).pack(anchor='w')
-            tk.Label(control_frame, text="🟢 Green: ≥50%", bg="white", fg="green", font=("Sarabun", 12)).pack(anchor='w')
-            tk.Label(control_frame, text="↑ ดีขึ้น", bg="white", fg="green", font=("Sarabun", 12)).pack(anchor='w')
-            tk.Label(control_frame, text="↓ แย่ลง", bg="white", fg="orange", font=("Sarabun", 12)).pack(anchor='w')
-
-            # Feedback label
-            feedback_label = tk.Label(control_frame, text="", bg="lightyellow", justify='left', wraplength=400, 
-                                     font=("Sarabun", 12), relief=tk.SUNKEN, padx=5, pady=5)
-            feedback_label.pack(fill='x', pady=10, padx=5)
-
-            # Create chart
-            fig, ax = plt.subplots(figsize=(12, 5), dpi=80)
-            fig.patch.set_facecolor('white')
-
-            dates = [h['date'] for h in history]
-            progresses = [h['progress'] for h in history]
-
-            # Prepare OHLC data
-            o, h_, l, c = [], [], [], []
-            prev = progresses[0] if progresses else 0
-            
-            for p in progresses:
-                o.append(prev)
-                c.append(p)
-                high = max(prev, p)
-                low = min(prev, p)
-                h_.append(high)
-                l.append(low)
-                prev = p
-
-            # Draw bars and lines
-            points = []
-            for i, p in enumerate(progresses):
-                prev_prog = progresses[i-1] if i > 0 else None
-                
-                if prev_prog is None:
-                    color = (1, 0, 0) if p < 50 else (0, 1, 0)
-                elif p > prev_prog:
-                    color = (0, 1, 0)
-                elif p < prev_prog:
-                    color = (1, 0.65, 0)
-                else:
-                    color = (1, 0, 0) if p < 50 else (0, 1, 0)
-
-                ax.vlines(dates[i], l[i], h_[i], color=color, linewidth=2)
-                ax.vlines(dates[i], o[i], c[i], color=color, linewidth=8)
-                
-                if prev_prog is not None:
-                    if p > prev_prog:
-                        ax.annotate('↑', xy=(dates[i], c[i]+3), ha='center', color='green', fontsize=12)
-                    elif p < prev_prog:
-                        ax.annotate('↓', xy=(dates[i], c[i]+3), ha='center', color='black', fontsize=12)
-                
-                point, = ax.plot(dates[i], c[i], 'o', color='black', markersize=8)
-                points.append((point, dates[i], p, history[i]['sets_done'], i))
-
-            ax.xaxis.set_major_formatter(mdates.DateFormatter('%d-%b'))
-            ax.set_ylabel("ความสำเร็จ (%)", font={'family': 'Sarabun', 'size': 18, 'weight': 'bold'})
-            ax.set_ylim(0, 110)
-            ax.set_title("สถิติของคุณ", font={'family': 'Sarabun', 'size': 18, 'weight': 'bold'})
-            ax.grid(True, linestyle='--', alpha=0.5)
-            fig.autofmt_xdate()
+            fig, canvas = self.current_chart
+            ax = self._chart_ax
+
+            x = mdates.date2num([h['date'] for h in history])
+            progresses = np.array([h['progress'] for h in history], dtype=float)
+
+            # OHLC: each day opens at the previous day's close
+            o = np.concatenate((progresses[:1], progresses[:-1]))
+            c = progresses
+            h_ = np.maximum(o, c)
+            l = np.minimum(o, c)
+
+            # Colors: green up, orange down, otherwise red/green by the 50% line
+            up = c > o
+            down = c < o
+            colors = np.where((c < 50)[:, None], (1.0, 0.0, 0.0), (0.0, 1.0, 0.0))
+            colors[up] = (0, 1, 0)
+            colors[down] = (1, 0.65, 0)
+
+            self._chart_thin.set_segments(np.stack((np.column_stack((x, l)), np.column_stack((x, h_))), axis=1))
+            self._chart_thin.set_color(colors)
+            self._chart_thick.set_segments(np.stack((np.column_stack((x, o)), np.column_stack((x, c))), axis=1))
+            self._chart_thick.set_color(colors)
+            self._chart_points.set_offsets(np.column_stack((x, c)))
+
+            for arrow in self._chart_arrows:
+                arrow.remove()
+            self._chart_arrows = (
+                [ax.annotate('↑', xy=(x[i], c[i]+3), ha='center', color='green', fontsize=12) for i in np.flatnonzero(up)]
+                + [ax.annotate('↓', xy=(x[i], c[i]+3), ha='center', color='black', fontsize=12) for i in np.flatnonzero(down)]
+            )
+
+            # x range from the new data only; y stays fixed at 0..110
+            ax.ignore_existing_data_limits = True
+            ax.update_datalim(np.column_stack((x, c)))
+            ax.autoscale_view(scaley=False)
             fig.tight_layout()
 
-            canvas = FigureCanvasTkAgg(fig, master=chart_frame)
-            canvas.draw()
-            canvas.get_tk_widget().pack(fill="both", expand=True)
+            self._chart_x, self._chart_c = x, c
 
             # Populate date combo
             date_list = [h['date'].strftime('%d-%b-%Y') for h in history]
-            date_combo['values'] = date_list
-            if date_list:
-                date_combo.set(date_list[-1])
-
-            def feedback_text(prog, prev_prog):
-                if prog == 0:
-                    return "วันนี้คุณยังไม่ได้ทำ 🔴"
-                elif prev_prog is not None and prog < prev_prog:
-                    return "วันนี้คุณทำได้น้อยลง ↓"
-                elif prev_prog is not None and prog > prev_prog:
-                    return "วันนี้คุณทำได้ดีขึ้น ↑"
-                elif prog < 50:
-                    return "วันนี้คุณทำได้น้อยลง ↓"
-                else:
-                    return "วันนี้คุณทำได้ตามปกติ ✓"
-
-            def update_feedback(event=None):
-                selected_date_str = date_var.get()
-                if not selected_date_str:
-                    return
-                try:
-                    selected_date = datetime.strptime(selected_date_str, '%d-%b-%Y').date()
-                    idx = next((i for i, h in enumerate(history) if h['date'].date() == selected_date), None)
-                    if idx is not None:
-                        prog = history[idx]['progress']
-                        sets = history[idx]['sets_done']
-                        prev_prog = history[idx-1]['progress'] if idx > 0 else None
-                        fb = feedback_text(prog, prev_prog)
-                        feedback_label.config(text=f"{selected_date_str}\nProgress: {prog:.0f}%\nSets: {sets}\n{fb}")
-                except Exception as e:
-                    print(f"Error: {e}")
-
-            def on_click(event):
-                if event.inaxes != ax:
-                    return
-                for point, date, prog, sets, idx in points:
-                    xdata = mdates.date2num(date)
-                    ydata = prog
-                    if abs(event.xdata - xdata) < 0.3 and abs(event.ydata - ydata) < 5:
-                        prev_prog = progresses[idx-1] if idx > 0 else None
-                        fb = feedback_text(prog, prev_prog)
-                        feedback_label.config(text=f"{date.strftime('%d-%b-%Y')}\nProgress: {prog:.0f}%\nSets: {sets}\n{fb}")
-                        date_var.set(date.strftime('%d-%b-%Y'))
-                        return
-
-            date_combo.bind("<<ComboboxSelected>>", update_feedback)
-            canvas.mpl_connect("button_press_event", on_click)
+            self._chart_date_index = {d: i for i, d in enumerate(date_list)}
+            self.chart_date_combo['values'] = date_list
+            self.chart_date_combo.set(date_list[-1])
 
             # Show initial feedback
-            update_feedback()
+            self._update_chart_feedback()
 
-            self.current_chart = (fig, canvas)
+            self.chart_message.pack_forget()
+            self.chart_main_frame.pack(fill=tk.BOTH, expand=True)
+            canvas.draw_idle()
 
         except Exception as e:
             print(f"Error drawing chart: {e}")
-            label = tk.Label(self.chart_container, text=f"Error: {e}", bg="white", font=("Sarabun", 12), fg="red")
-            label.pack(fill="both", expand=True)
+            self._chart_history = None
+            self._show_chart_message(f"Error: {e}", fg="red")
+
+    @staticmethod
+    def _chart_feedback_text(prog, prev_prog):
+        if prog == 0:
+            return "วันนี้คุณยังไม่ได้ทำ 🔴"
+        elif prev_prog is not None and prog < prev_prog:
+            return "วันนี้คุณทำได้น้อยลง ↓"
+        elif prev_prog is not None and prog > prev_prog:
+            return "วันนี้คุณทำได้ดีขึ้น ↑"
+        elif prog < 50:
+            return "วันนี้คุณทำได้น้อยลง ↓"
+        else:
+            return "วันนี้คุณทำได้ตามปกติ ✓"
+
+    def _show_chart_feedback(self, idx):
+        history = self._chart_history
+        prog = history[idx]['progress']
+        prev_prog = history[idx-1]['progress'] if idx > 0 else None
+        fb = self._chart_feedback_text(prog, prev_prog)
+        date_str = history[idx]['date'].strftime('%d-%b-%Y')
+        self.chart_feedback_label.config(text=f"{date_str}\nProgress: {prog:.0f}%\nSets: {history[idx]['sets_done']}\n{fb}")
+
+    def _update_chart_feedback(self, event=None):
+        idx = self._chart_date_index.get(self.chart_date_var.get())
+        if idx is not None:
+            self._show_chart_feedback(idx)
+
+    def _on_chart_click(self, event):
+        if event.inaxes != self._chart_ax:
+            return
+        # first point within 0.3 day / 5% of the click
+        hits = np.flatnonzero((np.abs(self._chart_x - event.xdata) < 0.3) & (np.abs(self._chart_c - event.ydata) < 5))
+        if hits.size:
+            idx = hits[0]
+            self._show_chart_feedback(idx)
+            self.chart_date_var.set(self._chart_history[idx]['date'].strftime('%d-%b-%Y'))
 
     # ============ PLAY SOUND ============
     def play_sounds_sequential(self, filename):
-        """Play a short sound file from Voices/ on a daemon thread."""
-        def _play(f=filename):
-            try:
-                if not f.endswith(".mp3"):
-                    f += ".mp3"
-                sound_path = f"Voices/{f}"
-                if os.path.exists(sound_path):
-                    sound = pygame.mixer.Sound(sound_path)
-                    sound.play()
-            except Exception as e:
-                print(f"Sound error: {e}")
-
-        threading.Thread(target=_play, daemon=True).start()
+        """Play a preloaded sound from Voices/ (the mixer plays it asynchronously)."""
+        try:
+            if not filename.endswith(".mp3"):
+                filename += ".mp3"
+            sound = self._sounds.get(filename)
+            if sound is not None:
+                sound.play()
+        except Exception as e:
+            print(f"Sound error: {e}")
 
     # ============ HISTORY UI ============
     def load_history(self):
-        """Load history text from file"""
+        """Load history text from file (only the part appended since last load)"""
+        self._flush_log()
+        path = "Anti-Finger.txt"
         try:
-            with open("Anti-Finger.txt", "r", encoding="utf-8") as f:
-                lines = f.readlines()
+            st = os.stat(path)
         except FileNotFoundError:
-            lines = ["No history found.\n"]
-
-        max_lines = 1000000000000
-        if len(lines) > max_lines:
-            lines = lines[-max_lines:]
+            self._hist_text_state = None
+            self._hist_text_offset = 0
+            self._set_history_text("No history found.\n", replace=True)
+            return
 
+        # Nothing changed since the last load -> keep the textbox as is
+        if (st.st_mtime_ns, st.st_size) == self._hist_text_state:
+            return
+        if st.st_size < self._hist_text_offset:
+            # file was truncated/replaced: reload from the start
+            self._hist_text_offset = 0
+
+        replace = self._hist_text_offset == 0
+        if replace:
+            # same newline handling as text mode: "\r\n" -> "\n" (Tk would draw the "\r")
+            self._hist_decoder = io.IncrementalNewlineDecoder(
+                codecs.getincrementaldecoder("utf-8")("replace"), translate=True)
+        with open(path, "rb") as f:
+            if replace and st.st_size > HISTORY_TAIL_BYTES:
+                # Fresh load of a long log: start at the tail, skipping the partial first line
+                f.seek(st.st_size - HISTORY_TAIL_BYTES)
+                f.readline()
+                self._hist_text_offset = f.tell()
+            else:
+                f.seek(self._hist_text_offset)
+            data = f.read()
+        # Everything up to EOF is shown, including a last line without "\n"; text
+        # appended later continues it in the textbox. The incremental decoder keeps
+        # a multi-byte char or a "\r" cut at EOF until its remaining bytes arrive.
+        self._hist_text_offset += len(data)
+        self._hist_text_state = (st.st_mtime_ns, st.st_size)
+        self._set_history_text(self._hist_decoder.decode(data), replace=replace)
+
+    def _set_history_text(self, text, replace=False):
         self.history_textbox.configure(state="normal")
-        self.history_textbox.delete("1.0", "end")
-        self.history_textbox.insert("end", "".join(lines))
+        if replace:
+            self.history_textbox.delete("1.0", "end")
+        self.history_textbox.insert("end", text)
+        extra = int(self.history_textbox.index("end-1c").split(".")[0]) - HISTORY_TAIL_LINES
+        if extra > 0:
+            self.history_textbox.delete("1.0", f"{extra + 1}.0")
         self.history_textbox.see("end")
         self.history_textbox.configure(state="disabled")
 
     def show_main_page(self):
+        self._preview_visible = True
         self.history_page.pack_forget()
         self.main_content_frame.pack(side="top", fill="both", expand=True, pady=20)
         self.play_sounds_sequential("010.mp3")
 
     def show_history_page(self):
+        self._preview_visible = False
         self.main_content_frame.pack_forget()
         self.play_sounds_sequential("009.mp3")
         self.history_page.pack(side="top", fill="both", expand=True, pady=20)
@@ -655,184 +868,350 @@ class AntiTriggerFingersApp(ctk.CTk):
     def write_log(self, message):
         now = datetime.now().strftime("[%Y-%m-%d %H:%M:%S]")
         log_message = f"{now} เซ็ตที่ {self.set} ครั้งที่ {self.round} : {message}"
+        self._log_q.put(log_message + "\n")
+        print(log_message)
+
+    def _flush_log(self):
+        """Block until every queued log line has been written and flushed."""
+        self._log_q.join()
+
+    def _log_writer(self):
+        """Background log thread: append queued lines, flush once the queue is empty.
+
+        A None item flushes and ends the thread (sent by on_close).
+        """
         try:
-            with open("Anti-Finger.txt", "a", encoding="utf-8") as f:
-                f.write(log_message + "\n")
-            print(log_message)
+            fh = open("Anti-Finger.txt", "a", encoding="utf-8", buffering=1 << 14)
         except Exception as e:
-            print(f"Error writing log: {e}")
+            fh = None
+            print(f"Error opening log: {e}")
+        while True:
+            line = self._log_q.get()
+            try:
+                if fh is not None:
+                    if line is not None:
+                        fh.write(line)
+                    if line is None or self._log_q.empty():
+                        fh.flush()
+            except Exception as e:
+                print(f"Error writing log: {e}")
+            finally:
+                self._log_q.task_done()
+            if line is None:
+                break
+        if fh is not None:
+            fh.close()
 
     # ============ CAMERA CHECK (FALLBACK) ============
     def check_fingers(self):
         try:
-            ret, frame = self.cap.read()
-            if not ret:
+            # Reuse the capture thread's newest frame (VideoCapture is not thread-safe)
+            # and count on a 4x-downsampled copy (16x fewer pixels); the threshold is a
+            # fraction of the pixels actually counted, so it holds at any resolution.
+            frame = self._latest_frame
+            if frame is None:
                 return
-            gray = cv2.cvtColor(frame, cv2.COLOR_BGR2GRAY)
-            thresh = cv2.threshold(gray, 127, 255, cv2.THRESH_BINARY)[1]
-            white_pixels = cv2.countNonZero(thresh)
-            if white_pixels > 50000:
-                if self.hand_posit < 5:
-                    self.hand_posit += 1
+            small = cv2.resize(frame, None, fx=0.25, fy=0.25, interpolation=cv2.INTER_AREA)
+            gray = cv2.cvtColor(small, cv2.COLOR_BGR2GRAY)
+            # same as THRESH_BINARY at 127 + countNonZero, without the mask image
+            white_pixels = np.count_nonzero(gray > 127)
+            if white_pixels > BRIGHT_FRACTION * gray.size:
+                with self._hand_posit_lock:
+                    if self.hand_posit < 5:
+                        self.hand_posit += 1
         except Exception as e:
-            print(f"[check_fingers] Error: {e}")
+            self._log_throttled("check_fingers", e)
+
+    def _log_throttled(self, tag, msg):
+        """print("[tag] msg") at most once per second per tag.
+
+        Used by the per-frame / per-tick paths, which would otherwise print (and
+        flush stdout) on every iteration while a failure persists.
+        """
+        now = time.monotonic()
+        if now - self._last_log_ts.get(tag, float("-inf")) >= 1.0:
+            self._last_log_ts[tag] = now
+            print(f"[{tag}] {msg}")
+
+    # ============ CAMERA CAPTURE LOOP ============
+    def _capture_loop(self):
+        """Background camera thread: keeps only the newest frame for MediaPipe.
+
+        Also publishes _latest_frame for check_fingers. While MediaPipe is busy
+        the frame is still decoded for it about once per second (the sensor
+        tick), so the fallback check never sees a frame older than ~1 s.
+        """
+        # Let MediaPipe and Tk win CPU contention: on Linux the nice value is
+        # per-thread, so this lowers only this thread (elsewhere it would be
+        # process-wide, so it is skipped). No core pinning: threads MediaPipe
+        # spawns inherit their creator's affinity mask and would lose parallelism.
+        if sys.platform.startswith("linux"):
+            try:
+                os.nice(5)
+            except OSError:
+                pass
+        next_latest = 0.0
+        while self.mp_running:
+            # grab() drains the driver buffer so frames never go stale; decoding
+            # (retrieve) is skipped while MediaPipe still has an unread frame,
+            # except for the once-per-second refresh of _latest_frame.
+            ret = self.cap.grab()
+            queue_full = ret and self._frame_q.full()
+            if queue_full and time.monotonic() < next_latest:
+                continue
+            if ret:
+                ret, frame = self.cap.retrieve()
+            if not ret:
+                self._log_throttled("Capture", "Frame capture failed, retrying...")
+                time.sleep(0.01)
+                continue
+            self._latest_frame = frame
+            next_latest = time.monotonic() + 1.0
+            if not queue_full:
+                self._put_latest(self._frame_q, frame)
 
     # ============ MEDIAPIPE BACKGROUND LOOP ============
     def _mediapipe_loop(self):
         """Background MediaPipe detection thread"""
-        mp_hands = mp.solutions.hands
-        mp_drawing = mp.solutions.drawing_utils
-        drawing_spec_landmark = mp_drawing.DrawingSpec(color=(0, 255, 0), thickness=2, circle_radius=4)
-        drawing_spec_connection = mp_drawing.DrawingSpec(color=(255, 0, 0), thickness=2, circle_radius=2)
-
-        hands = mp_hands.Hands(
-            static_image_mode=False, max_num_hands=1,
-            min_detection_confidence=0.5, min_tracking_confidence=0.5
-        )
-
-        pose_ranges = {
-            1: [(0, 200), (150, 185), (150, 185), (150, 185), (150, 185)],
-            2: [(0, 200), (40, 170), (40, 170), (40, 170), (40, 170)],
-            3: [(0, 200), (0, 60), (0, 60), (0, 60), (0, 60)],
-            4: [(0, 200), (0, 50), (0, 50), (0, 50), (0, 50)],
-            5: [(0, 200), (50, 185), (50, 185), (50, 160), (50, 160)],
-        }
+        detect_hands, close_hands = self._create_hand_detector()
+        # Inference frame keeps the preview's aspect ratio (no squashed hands);
+        # landmarks come back normalized, so they apply to the preview as-is.
+        scale = INFER_LONG_SIDE / max(self.camera_width, self.camera_height)
+        infer_size = (round(self.camera_width * scale), round(self.camera_height * scale))
+        # Reused every frame: detection is synchronous, so one buffer is enough
+        infer_buf = np.zeros((infer_size[1], infer_size[0], 3), dtype=np.uint8)
+        # Warm up now, while idle: the first inferences build the TFLite graph and
+        # delegate (~0.5-1 s), which would otherwise freeze the preview on "Start".
+        try:
+            infer_buf.flags.writeable = False
+            for _ in range(2):
+                detect_hands(infer_buf)
+            infer_buf.flags.writeable = True
+        except Exception as e:
+            print(f"[MediaPipe] warmup failed: {e}")
 
-        def _angle_between(a, b):
-            import math
-            ax, ay = a
-            bx, by = b
-            dot = ax * bx + ay * by
-            na = (ax * ax + ay * ay) ** 0.5
-            nb = (bx * bx + by * by) ** 0.5
-            if na == 0 or nb == 0:
-                return 0.0
-            cosv = max(-1.0, min(1.0, dot / (na * nb)))
-            return math.degrees(math.acos(cosv))
+        hand_list = []
+        frames_since_infer = 0
 
         try:
             while self.mp_running:
-                ret, frame = self.cap.read()
-                if not ret:
-                    print("[MediaPipe] Frame capture failed, retrying...")
-                    time.sleep(0.01)
+                # Preview hidden (history page): nothing to process or show
+                if not self._preview_visible:
+                    time.sleep(0.05)
+                    continue
+                try:
+                    frame = self._frame_q.get(timeout=0.1)
+                except queue.Empty:
                     continue
 
-                frame = cv2.flip(frame, 1)
+                # Crop/resize to the preview size first: mirroring, MediaPipe, drawing and
+                # the PIL conversion then all work on the small frame. The crop is a
+                # centred view, so mirroring afterwards (in place) gives the same picture.
+                frame = self._crop_and_resize(frame, self.camera_width, self.camera_height)
+                cv2.flip(frame, 1, dst=frame)
                 h, w = frame.shape[:2]
-                rgb = cv2.cvtColor(frame, cv2.COLOR_BGR2RGB)
-                results = hands.process(rgb)
+                # frame is a fresh array from the resize, so convert it in place. It is
+                # handed on to the UI thread, so it must not be a shared buffer.
+                rgb = cv2.cvtColor(frame, cv2.COLOR_BGR2RGB, dst=frame)
+                # Only run MediaPipe while an exercise is running; idle keeps a live preview
+                infer_every = HOLD_INFER_EVERY if self.hand_posit == 5 else SEARCH_INFER_EVERY
+                fresh = False
+                if not self.running:
+                    hand_list = []
+                elif frames_since_infer >= infer_every - 1:
+                    cv2.resize(rgb, infer_size, dst=infer_buf, interpolation=cv2.INTER_AREA)
+                    # Read-only lets MediaPipe wrap the buffer instead of copying it
+                    infer_buf.flags.writeable = False
+                    hand_list = detect_hands(infer_buf)
+                    infer_buf.flags.writeable = True
+                    frames_since_infer = 0
+                    fresh = True
+                else:
+                    # Between detections: keep drawing/matching the last landmarks
+                    frames_since_infer += 1
 
-                # Initialize angles with default values
-                thumb_a = index_a = middle_a = ring_a = pinky_a = 0
                 pose_match = False
 
-                if results.multi_hand_landmarks:
-                    for hand_landmarks in results.multi_hand_landmarks:
-                        mp_drawing.draw_landmarks(
-                            frame, hand_landmarks, mp_hands.HAND_CONNECTIONS,
-                            drawing_spec_landmark, drawing_spec_connection
-                        )
-
+                if hand_list:
+                    for hand_landmarks in hand_list:
+                        # (21, 2) pixel coordinates, then all five finger angles at once:
+                        # angle at the MCP between (tip - mcp) and (wrist - mcp)
                         lm = hand_landmarks.landmark
+                        pts = np.fromiter((c for p in lm for c in (p.x, p.y)), dtype=np.float64, count=42).reshape(21, 2) * (w, h)
+
+                        if self.show_landmarks:
+                            # Same picture as mp drawing_utils, from the pixel array we already have
+                            px = pts.astype(np.int32)
+                            cv2.polylines(rgb, [px[path] for path in HAND_PATHS], False, CONNECTION_COLOR, 2)
+                            for x, y in px.tolist():
+                                cv2.circle(rgb, (x, y), 4, LANDMARK_COLOR, 2)
+
+                        v1 = pts[TIP_IDX] - pts[MCP_IDX]
+                        v2 = pts[0] - pts[MCP_IDX]
+                        # atan2(|cross|, dot): no norms/clamp, stable near 0/180 degrees,
+                        # and a zero-length vector gives atan2(0, 0) = 0 degrees (as before)
+                        dot = (v1 * v2).sum(axis=1)
+                        cross = v1[:, 0] * v2[:, 1] - v1[:, 1] * v2[:, 0]
+                        angles = np.degrees(np.arctan2(np.abs(cross), dot))
+
+                        # read once: the Tk thread may change current_pose mid-frame
+                        pose = self.current_pose
+                        lo = self._pose_lo[pose]
+                        hi = self._pose_hi[pose]
+                        pose_match = bool(((angles >= lo) & (angles <= hi)).all())
+
+                        cv2.putText(rgb, f"Match:{'YES' if pose_match else 'NO'}", (10, 180),
+                            cv2.FONT_HERSHEY_SIMPLEX, 0.6, (0, 200, 0) if pose_match else (200, 0, 0), 2)
+
+                # Pose state is kept here, off the Tk thread; the UI only gets images.
+                # Only fresh detections count, so hand_posit still means 5 in a row.
+                if fresh or not self.running:
+                    with self._hand_posit_lock:
+                        self.hand_posit = min(self.hand_posit + 1, 5) if pose_match else 0
+
+                self._put_latest(self._result_q, rgb)
+        finally:
+            close_hands()
 
-                        def to_pt(idx):
-                            return (lm[idx].x * w, lm[idx].y * h)
-
-                        wrist = to_pt(0)
-
-                        # Thumb
-                        v1 = (to_pt(4)[0] - to_pt(2)[0], to_pt(4)[1] - to_pt(2)[1])
-                        v2 = (wrist[0] - to_pt(2)[0], wrist[1] - to_pt(2)[1])
-                        thumb_a = _angle_between(v1, v2)
-
-                        # Index
-                        v1 = (to_pt(8)[0] - to_pt(5)[0], to_pt(8)[1] - to_pt(5)[1])
-                        v2 = (wrist[0] - to_pt(5)[0], wrist[1] - to_pt(5)[1])
-                        index_a = _angle_between(v1, v2)
-
-                        # Middle
-                        v1 = (to_pt(12)[0] - to_pt(9)[0], to_pt(12)[1] - to_pt(9)[1])
-                        v2 = (wrist[0] - to_pt(9)[0], wrist[1] - to_pt(9)[1])
-                        middle_a = _angle_between(v1, v2)
-
-                        # Ring
-                        v1 = (to_pt(16)[0] - to_pt(13)[0], to_pt(16)[1] - to_pt(13)[1])
-                        v2 = (wrist[0] - to_pt(13)[0], wrist[1] - to_pt(13)[1])
-                        ring_a = _angle_between(v1, v2)
-
-                        # Pinky
-                        v1 = (to_pt(20)[0] - to_pt(17)[0], to_pt(20)[1] - to_pt(17)[1])
-                        v2 = (wrist[0] - to_pt(17)[0], wrist[1] - to_pt(17)[1])
-                        pinky_a = _angle_between(v1, v2)
-
-                        reqs = pose_ranges.get(self.current_pose, pose_ranges[1])
-                        angles = [thumb_a, index_a, middle_a, ring_a, pinky_a]
-                        
-                        ok = True
-                        for ang, (mn, mx) in zip(angles, reqs):
-                            if ang is None or not (mn <= ang <= mx):
-                                ok = False
-                                break
-                        pose_match = ok
-
-                        try:
-                            cv2.putText(frame, f"Match:{'YES' if pose_match else 'NO'}", (10, 180),
-                                cv2.FONT_HERSHEY_SIMPLEX, 0.6, (0, 200, 0) if pose_match else (0, 0, 200), 2)
-                        except Exception:
-                            pass
-
-                display_rgb = cv2.cvtColor(frame, cv2.COLOR_BGR2RGB)
-                pil_img = Image.fromarray(display_rgb)
-
-                def _crop_and_resize(img, target_w, target_h):
-                    src_w, src_h = img.size
-                    target_ratio = target_w / target_h
-                    src_ratio = src_w / src_h
-                    if src_ratio > target_ratio:
-                        new_w = int(src_h * target_ratio)
-                        left = (src_w - new_w) // 2
-                        img = img.crop((left, 0, left + new_w, src_h))
-                    else:
-                        new_h = int(src_w / target_ratio)
-                        top = (src_h - new_h) // 2
-                        img = img.crop((0, top, src_w, top + new_h))
-                    return img.resize((target_w, target_h), Image.LANCZOS)
-
-                pil_img = _crop_and_resize(pil_img, self.camera_width, self.camera_height)
+    def _create_hand_detector(self):
+        """Return (detect, close); detect(rgb) -> list of NormalizedLandmarkList."""
+        if os.path.exists(HAND_MODEL_PATH):
+            try:
+                from mediapipe.tasks import python as mp_py
+                from mediapipe.tasks.python import vision as mp_vision
+                from mediapipe.framework.formats import landmark_pb2
+
+                options = mp_vision.HandLandmarkerOptions(
+                    base_options=mp_py.BaseOptions(
+                        model_asset_path=HAND_MODEL_PATH, delegate=mp_py.BaseOptions.Delegate.GPU
+                    ),
+                    running_mode=mp_vision.RunningMode.VIDEO, num_hands=1,
+                    min_hand_detection_confidence=0.5, min_tracking_confidence=0.6
+                )
+                landmarker = mp_vision.HandLandmarker.create_from_options(options)
+                t0 = time.monotonic()
+                last_ts = [-1]
+
+                def detect(rgb):
+                    # VIDEO mode needs strictly increasing timestamps (ms)
+                    ts = max(int((time.monotonic() - t0) * 1000), last_ts[0] + 1)
+                    last_ts[0] = ts
+                    result = landmarker.detect_for_video(mp.Image(image_format=mp.ImageFormat.SRGB, data=rgb), ts)
+                    # Same proto type as the Hands solution so the detection loop works unchanged
+                    return [
+                        landmark_pb2.NormalizedLandmarkList(landmark=[
+                            landmark_pb2.NormalizedLandmark(x=p.x, y=p.y, z=p.z) for p in hand
+                        ])
+                        for hand in result.hand_landmarks
+                    ]
+
+                print("✓ MediaPipe HandLandmarker running on GPU")
+                return detect, landmarker.close
+            except Exception as e:
+                print(f"[MediaPipe] GPU HandLandmarker unavailable, using CPU Hands: {e}")
+
+        # Video mode: the landmark model tracks the hand ROI from the previous frame and
+        # the (slow) palm detector only re-runs when tracking confidence drops below 0.6.
+        # One hand is enough for this single-user trainer; complexity 0 is the lite model.
+        hands = mp.solutions.hands.Hands(
+            static_image_mode=False, max_num_hands=1, model_complexity=0,
+            min_detection_confidence=0.5, min_tracking_confidence=0.6
+        )
+
+        def detect(rgb):
+            return hands.process(rgb).multi_hand_landmarks or []
+
+        return detect, hands.close
 
+    def _encode_loop(self):
+        """Background UI-delivery thread: hand processed frames to Tk"""
+        # Deadline pacing: sleep only for what is left of the frame period
+        target_dt = 1.0 / min(self.target_fps, PREVIEW_MAX_FPS)
+        deadline = time.monotonic()
+        while self.mp_running:
+            try:
+                rgb = self._result_q.get(timeout=0.1)
+            except queue.Empty:
+                continue
+
+            pil_img = Image.fromarray(rgb)
+
+            # Keep only the newest result; schedule at most one drain per idle slot
+            # so Tk never works through a backlog of stale frames.
+            with self._pending_ui_lock:
+                self._pending_ui = pil_img
+                schedule = not self._drain_scheduled
+                self._drain_scheduled = True
+            if schedule:
                 try:
-                    self.after(0, lambda im=pil_img, a=(thumb_a, index_a, middle_a, ring_a, pinky_a), m=pose_match: (
-                        self._update_camera_label(im),
-                        self._apply_pose_detection(a, m)
-                    ))
+                    self.after_idle(self._drain_pending_ui)
                 except RuntimeError:
                     break
 
-                time.sleep(0.02)
-        finally:
-            hands.close()
-
-    def _apply_pose_detection(self, angles, match):
+            deadline += target_dt
+            now = time.monotonic()
+            if deadline < now - 2 * target_dt:
+                # fell far behind: resync instead of bursting to catch up
+                deadline = now
+            if deadline > now:
+                time.sleep(deadline - now)
+
+    def _drain_pending_ui(self):
+        """Main-thread handler: show the newest frame from _encode_loop."""
+        with self._pending_ui_lock:
+            pil_img = self._pending_ui
+            self._pending_ui = None
+            self._drain_scheduled = False
+        if pil_img is None:
+            return
         try:
-            if match:
-                if self.hand_posit < 5:
-                    self.hand_posit += 1
-            else:
-                self.hand_posit = 0
+            # Paste into the PhotoImage created in __init__ (same size) instead of
+            # allocating a new one per frame; the label redraws automatically.
+            self.camera_photo.paste(pil_img)
+            self.check_sensor_loop()
         except Exception as e:
-            print(f"[Pose Apply] {e}")
-
-    def _update_camera_label(self, pil_image):
+            self._log_throttled("Camera Update", e)
+
+    @staticmethod
+    def _crop_and_resize(img, target_w, target_h):
+        """Center-crop a frame to the target aspect ratio, then resize it."""
+        src_h, src_w = img.shape[:2]
+        target_ratio = target_w / target_h
+        src_ratio = src_w / src_h
+        if src_ratio > target_ratio:
+            new_w = int(src_h * target_ratio)
+            left = (src_w - new_w) // 2
+            img = img[:, left:left + new_w]
+        else:
+            new_h = int(src_w / target_ratio)
+            top = (src_h - new_h) // 2
+            img = img[top:top + new_h]
+        # INTER_AREA is best for shrinking but acts like nearest-neighbour when enlarging
+        interp = cv2.INTER_AREA if img.shape[1] >= target_w else cv2.INTER_LINEAR
+        return cv2.resize(img, (target_w, target_h), interpolation=interp)
+
+    @staticmethod
+    def _put_latest(q, item):
+        """Put item into a maxsize=1 queue, replacing a stale item if one is waiting."""
         try:
-            self.camera_photo = ImageTk.PhotoImage(pil_image)
-            self.camera_label.configure(image=self.camera_photo)
-        except Exception as e:
-            print(f"[Camera Update] {e}")
+            q.put_nowait(item)
+        except queue.Full:
+            try:
+                q.get_nowait()
+            except queue.Empty:
+                pass
+            try:
+                q.put_nowait(item)
+            except queue.Full:
+                pass
+
+    def toggle_landmarks(self):
+        self.show_landmarks = not self.show_landmarks
 
     def timer_reset(self):
         self.time_current = self.time_max
-        self.hand_posit = 0
+        with self._hand_posit_lock:
+            self.hand_posit = 0
         self.update_timer()
         self.reset_pic()
         try:
@@ -844,10 +1223,31 @@ class AntiTriggerFingersApp(ctk.CTk):
         return
 
     def reset_pic(self):
-        self.timer_canvas.delete("progress")
-        l = self.timer_pad
-        r = self.timer_canvas_size - self.timer_pad
-        self.timer_canvas.create_oval(l, l, r, r, outline="#3CB371", width=10, tags="progress")
+        self._timer_show_ring()
+
+    def _timer_show_ring(self):
+        """Show the neutral full circle (idle / new pose)."""
+        if self._timer_arc_state is None:
+            return
+        self._timer_arc_state = None
+        self.timer_canvas.itemconfigure(self.timer_arc_id, state="hidden")
+        self.timer_canvas.itemconfigure(self.timer_ring_id, state="normal")
+
+    def _timer_show_arc(self, extent, color="#3CB371"):
+        """Show the progress arc, drawn clockwise over `extent` degrees."""
+        state = (round(extent), color)               # whole degrees: finer steps are invisible
+        if state == self._timer_arc_state:
+            return
+        if self._timer_arc_state is None:
+            self.timer_canvas.itemconfigure(self.timer_ring_id, state="hidden")
+        self._timer_arc_state = state
+        self.timer_canvas.itemconfigure(self.timer_arc_id, extent=-state[0], outline=color, state="normal")
+
+    def _timer_set_text(self, text):
+        """Set the timer number, skipping the redraw when it has not changed."""
+        if text != self._timer_text_value:
+            self._timer_text_value = text
+            self.timer_canvas.itemconfigure(self.timer_text, text=text)
 
     def update_timer(self):
         try:
@@ -860,62 +1260,71 @@ class AntiTriggerFingersApp(ctk.CTk):
             self._timer_prev_sec = prev_time
             self._timer_anim_from = from_prog
             self._timer_anim_to = to_prog
-            self._timer_anim_start = time.time()
+            self._timer_anim_start = time.monotonic()
             self._timer_anim_duration = 1.0
-            self.timer_anim_job = self.after(0, self._animate_timer)
+            self._timer_anim_active = True
+            self._start_timer_tick()
         except Exception as e:
-            print(f"[update_timer] {e}")
+            self._log_throttled("update_timer", e)
+
+    def _start_timer_tick(self):
+        if self._tick_job is None:
+            self._tick_deadline = time.monotonic()
+            self._tick_job = self.after(0, self._timer_tick)
 
-    def _animate_timer(self):
+    def _timer_tick(self):
+        """One Tk tick for both the pre-start countdown and the per-second timer arc.
+
+        Runs on a fixed TIMER_TICK_S grid of the monotonic clock while either is
+        active, and stops rescheduling itself once both are done.
+        """
+        self._tick_job = None
+        now = time.monotonic()
         try:
-            now = time.time()
-            elapsed = now - self._timer_anim_start
-            t = min(1.0, max(0.0, elapsed / float(self._timer_anim_duration)))
-            progress = self._timer_anim_from + (self._timer_anim_to - self._timer_anim_from) * t
-            extent = 360 * progress
+            if self.countdown_active:
+                self._animate_countdown(now)
+            elif self._timer_anim_active:
+                self._animate_timer(now)
+        except Exception as e:
+            self._log_throttled("_timer_tick", e)
+            self._timer_anim_active = False
 
-            self.timer_canvas.delete("progress")
-            l = self.timer_pad
-            r = self.timer_canvas_size - self.timer_pad
-            self.timer_canvas.create_arc(l, l, r, r, start=-90, extent=-extent, style="arc", width=10, outline="#3CB371", tags="progress")
+        if self.countdown_active or self._timer_anim_active:
+            # next grid point; if we fell behind, tick as soon as possible instead of bursting
+            self._tick_deadline = max(self._tick_deadline + TIMER_TICK_S, now)
+            delay_ms = max(1, int((self._tick_deadline - time.monotonic()) * 1000))
+            self._tick_job = self.after(delay_ms, self._timer_tick)
 
-            try:
-                prev = getattr(self, "_timer_prev_sec", self.time_current + 1)
-                interp = prev + (self.time_current - prev) * t
-                interp = max(float(self.time_current), min(float(prev), interp))
-                secs = int(__import__("math").ceil(interp))
-            except Exception:
-                secs = int(max(0, self.time_current))
-            self.timer_canvas.itemconfig(self.timer_text, text=str(secs))
+    def _animate_timer(self, now):
+        elapsed = now - self._timer_anim_start
+        t = min(1.0, max(0.0, elapsed / float(self._timer_anim_duration)))
+        progress = self._timer_anim_from + (self._timer_anim_to - self._timer_anim_from) * t
+        extent = 360 * progress
 
-            if t < 1.0:
-                self.timer_anim_job = self.after(50, self._animate_timer)
-            else:
-                self.timer_anim_job = None
-                self.timer_canvas.delete("progress")
-                l = self.timer_pad
-                r = self.timer_canvas_size - self.timer_pad
-                self.timer_canvas.create_arc(l, l, r, r, start=-90, extent=-360 * self._timer_anim_to, style="arc", width=10, outline="#3CB371", tags="progress")
-                self.timer_canvas.itemconfig(self.timer_text, text=str(self.time_current))
-        except Exception as e:
-            print(f"[_animate_timer] {e}")
-            self.timer_anim_job = None
+        self._timer_show_arc(extent)
+
+        try:
+            prev = getattr(self, "_timer_prev_sec", self.time_current + 1)
+            interp = prev + (self.time_current - prev) * t
+            interp = max(float(self.time_current), min(float(prev), interp))
+            secs = int(math.ceil(interp))
+        except Exception:
+            secs = int(max(0, self.time_current))
+        self._timer_set_text(str(secs))
+
+        if t >= 1.0:
+            self._timer_anim_active = False
+            self._timer_show_arc(360 * self._timer_anim_to)
+            self._timer_set_text(str(self.time_current))
 
     def _stop_timer_animation(self):
         try:
-            if self.timer_anim_job:
-                try:
-                    self.after_cancel(self.timer_anim_job)
-                except Exception:
-                    pass
-                self.timer_anim_job = None
+            # the tick stops rescheduling itself once nothing is active
+            self._timer_anim_active = False
             progress = (self.time_max - self.time_current) / float(self.time_max) if self.time_max else 0.0
             extent = 360 * progress
-            self.timer_canvas.delete("progress")
-            l = self.timer_pad
-            r = self.timer_canvas_size - self.timer_pad
-            self.timer_canvas.create_arc(l, l, r, r, start=-90, extent=-extent, style="arc", width=10, outline="#3CB371", tags="progress")
-            self.timer_canvas.itemconfig(self.timer_text, text=str(self.time_current))
+            self._timer_show_arc(extent)
+            self._timer_set_text(str(self.time_current))
         except Exception as e:
             print(f"[_stop_timer_animation] {e}")
 
@@ -927,11 +1336,19 @@ class AntiTriggerFingersApp(ctk.CTk):
         self.Label_set_times_number.configure(text=f"{self.round}")
         self.Label_set_number.configure(text=f"{self.set}")
 
+    def _get_pose_photo(self, pose):
+        """Cached 300x300 PhotoImage for an example pose (None if the file is missing)."""
+        try:
+            return load_photo(f"pictures/EX_POSE/pose{pose}.png", 300, 300, Image.BILINEAR)
+        except FileNotFoundError:
+            return None
+
     def update_EX_pose(self):
+        photo = self._get_pose_photo(self.current_pose)
+        if photo is None:
+            return
         try:
-            small_hand_image_pil = Image.open(f"pictures/EX_POSE/pose{self.current_pose}.png")
-            small_hand_image_pil = small_hand_image_pil.resize((300, 300))
-            self.small_hand_photo = ImageTk.PhotoImage(small_hand_image_pil)
+            self.small_hand_photo = photo
             self.small_hand_label.configure(image=self.small_hand_photo)
         except:
             pass
@@ -956,62 +1373,29 @@ class AntiTriggerFingersApp(ctk.CTk):
         self._cancel_countdown()
         self.countdown_active = True
         self.countdown_total = max(1, seconds)
-        self.countdown_end_time = time.time() + self.countdown_total
-        self.countdown_job = self.after(0, self._animate_countdown)
+        self.countdown_end_time = time.monotonic() + self.countdown_total
+        self._start_timer_tick()
 
-    def _animate_countdown(self):
-        if not self.countdown_active:
-            return
-        import math, time as _time
-        now = _time.time()
+    def _animate_countdown(self, now):
         remaining = self.countdown_end_time - now
         if remaining <= 0:
             self.countdown_active = False
-            self.countdown_job = None
             self.running = True
-            try:
-                self.timer_canvas.itemconfig(self.timer_text, text=str(self.time_current))
-                self.timer_canvas.delete("progress")
-                l = self.timer_pad
-                r = self.timer_canvas_size - self.timer_pad
-                self.timer_canvas.create_oval(l, l, r, r, outline="#3CB371", width=10, tags="progress")
-            except Exception:
-                pass
+            self._timer_set_text(str(self.time_current))
+            self._timer_show_ring()
+            return
 
         frac = max(0.0, min(1.0, remaining / float(self.countdown_total)))
-        extent = 360 * frac
-
-        try:
-            self.timer_canvas.delete("progress")
-            l = self.timer_pad
-            r = self.timer_canvas_size - self.timer_pad
-            self.timer_canvas.create_arc(l, l, r, r, start=-90, extent=-extent, style="arc", width=10, outline="#FFA500", tags="progress")
-            secs = int(math.ceil(remaining))
-            self.timer_canvas.itemconfig(self.timer_text, text=str(secs))
-        except Exception:
-            pass
-
-        try:
-            self.countdown_job = self.after(50, self._animate_countdown)
-        except Exception:
-            self.countdown_active = False
-            self.countdown_job = None
+        self._timer_show_arc(360 * frac, "#FFA500")
+        self._timer_set_text(str(int(math.ceil(remaining))))
 
     def _cancel_countdown(self):
         if self.countdown_active:
+            # the pending tick sees countdown_active == False and stops
             self.countdown_active = False
-            if self.countdown_job:
-                try:
-                    self.after_cancel(self.countdown_job)
-                except Exception:
-                    pass
-                self.countdown_job = None
             try:
-                self.timer_canvas.itemconfig(self.timer_text, text=str(self.time_current))
-                self.timer_canvas.delete("progress")
-                l = self.timer_pad
-                r = self.timer_canvas_size - self.timer_pad
-                self.timer_canvas.create_oval(l, l, r, r, outline="#3CB371", width=10, tags="progress")
+                self._timer_set_text(str(self.time_current))
+                self._timer_show_ring()
             except Exception:
                 pass
 
@@ -1038,11 +1422,14 @@ class AntiTriggerFingersApp(ctk.CTk):
     def on_close(self):
         self.mp_running = False
         self.running = False
-        try:
-            if hasattr(self, "mp_thread") and self.mp_thread.is_alive():
-                self.mp_thread.join(timeout=1.0)
-        except Exception:
-            pass
+        self._log_q.put(None)
+        for name in ("_log_thread", "capture_thread", "mp_thread", "encode_thread"):
+            try:
+                t = getattr(self, name, None)
+                if t is not None and t.is_alive():
+                    t.join(timeout=1.0)
+            except Exception:
+                pass
         try:
             if self.cap is not None and self.cap.isOpened():
                 self.cap.release()
@@ -1052,30 +1439,43 @@ class AntiTriggerFingersApp(ctk.CTk):
         os._exit(0)
         
     def check_sensor_loop(self):
-        if self.running:
+        """1 s sensor tick, driven by detection frames instead of a polling timer.
+
+        Called for every processed frame; does work at most once per second and
+        only while running, so an idle app has no periodic wakeup.
+        """
+        if not self.running:
+            self._hold_tick = None
+            return
+        now = time.monotonic()
+        if self._hold_tick is None:
+            self._hold_tick = now + 1.0
+            return
+        if now < self._hold_tick:
+            return
+        self._hold_tick += 1.0
+        if self._hold_tick <= now:
+            # frames stalled (e.g. history page): resume without catching up
+            self._hold_tick = now + 1.0
+
+        try:
+            self.check_fingers()
+        except Exception as e:
+            self._log_throttled("check_sensor_loop", f"check_fingers error: {e}")
+
+        if self.hand_posit == 5 and self.time_current > 0 and not self.still_hold:
             try:
-                self.check_fingers()
+                self.time_current -= 1
+                self.update_timer()
             except Exception as e:
-                print(f"[check_sensor_loop] check_fingers error: {e}")
+                self._log_throttled("check_sensor_loop", f"timer update error: {e}")
 
-            if self.hand_posit == 5 and self.time_current > 0 and not self.still_hold:
+            if self.time_current <= 0:
                 try:
-                    self.time_current -= 1
-                    self.update_timer()
+                    delay_ms = int(getattr(self, "_timer_anim_duration", 1.0) * 1000) + 50
+                    self.after(delay_ms, self._on_pose_success)
                 except Exception as e:
-                    print(f"[check_sensor_loop] timer update error: {e}")
-
-                if self.time_current <= 0:
-                    try:
-                        delay_ms = int(getattr(self, "_timer_anim_duration", 1.0) * 1000) + 50
-                        self.after(delay_ms, self._on_pose_success)
-                    except Exception as e:
-                        print(f"[check_sensor_loop] scheduling _on_pose_success error: {e}")
-
-        try:
-            self.after(1000, self.check_sensor_loop)
-        except Exception as e:
-            print(f"[check_sensor_loop] scheduling error: {e}")
+                    self._log_throttled("check_sensor_loop", f"scheduling _on_pose_success error: {e}")
 
     def _on_pose_success(self):
         try:
@@ -1085,9 +1485,13 @@ class AntiTriggerFingersApp(ctk.CTk):
         except Exception as e:
             print(f"[_on_pose_success] write_log error: {e}")
 
-        self.current_pose += 1
-        if self.current_pose > 5:
-            self.current_pose = 1
+        # assign once: the MediaPipe thread indexes _pose_lo/_pose_hi with it,
+        # so it must never hold the out-of-range 6 even briefly
+        next_pose = self.current_pose + 1
+        if next_pose > 5:
+            next_pose = 1
+        self.current_pose = next_pose
+        if next_pose == 1:
             self.round += 1
             if self.round >= 10:
                 self.round = 0